@@ -10,6 +10,7 @@ from __future__ import annotations
 import argparse
 import re
 import sys
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -79,38 +80,61 @@ MANUAL_FILES = [
     "CHANGELOG.md",
 ]
 
+_SEMVER_RE = re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+$")
+
 
 def validate_version(version: str) -> bool:
     """Validate version string is semver format."""
-    return bool(re.match(r"^[0-9]+\.[0-9]+\.[0-9]+$", version))
+    return bool(_SEMVER_RE.match(version))
+
+
+def group_updates(
+    updates: list[VersionUpdate],
+) -> dict[str, list[tuple[re.Pattern[str], str]]]:
+    """Compile each pattern once and group updates by target file."""
+    by_file: dict[str, list[tuple[re.Pattern[str], str]]] = defaultdict(list)
+    for item in updates:
+        by_file[item.file_path].append(
+            (re.compile(item.pattern), item.replacement_template)
+        )
+    return by_file
 
 
 def update_file(
-    filepath: Path, pattern: str, replacement: str, dry_run: bool = False
-) -> tuple[bool, int]:
-    """Update a single file with the new version.
+    filepath: Path,
+    updates: list[tuple[re.Pattern[str], str]],
+    version: str,
+    dry_run: bool = False,
+) -> tuple[int, int]:
+    """Apply every version pattern for one file, writing it at most once.
 
     Returns:
-        tuple: (success, replacement_count)
+        tuple: (updated_location_count, failed_location_count)
     """
     if not filepath.exists():
         print(f"  ERROR: File not found: {filepath}")
-        return False, 0
+        return 0, len(updates)
 
     content = filepath.read_text()
-    new_content, count = re.subn(pattern, replacement, content)
-    if count == 0:
-        print(f"  ERROR: Pattern not found in {filepath}")
-        print(f"         Pattern: {pattern}")
-        return False, 0
+    updated = failed = total = 0
+    for pattern, template in updates:
+        content, count = pattern.subn(template.format(version=version), content)
+        if count == 0:
+            print(f"  ERROR: Pattern not found in {filepath}")
+            print(f"         Pattern: {pattern.pattern}")
+            failed += 1
+        else:
+            updated += 1
+            total += count
 
-    if dry_run:
-        print(f"  [DRY RUN] Would update: {filepath} ({count} replacement(s))")
-    else:
-        filepath.write_text(new_content)
-        print(f"  Updated: {filepath} ({count} replacement(s))")
+    if updated:
+        if dry_run:
+            print(f"  [DRY RUN] Would update: {filepath} ({total} replacement(s))")
+        else:
+            filepath.write_text(content)
+            print(f"  Updated: {filepath} ({total} replacement(s))")
 
-    return True, count
+    return updated, failed
 
 
 def main() -> int:
@@ -142,15 +166,10 @@ def main() -> int:
     success_count = 0
     error_count = 0
 
-    for item in VERSION_UPDATES:
-        filepath = root / item.file_path
-        replacement = item.replacement_template.format(version=version)
-
-        ok, _ = update_file(filepath, item.pattern, replacement, args.dry_run)
-        if ok:
-            success_count += 1
-        else:
-            error_count += 1
+    for file_rel, updates in group_updates(VERSION_UPDATES).items():
+        updated, failed = update_file(root / file_rel, updates, version, args.dry_run)
+        success_count += updated
+        error_count += failed
 
     for file_rel in MANUAL_FILES:
         filepath = root / file_rel
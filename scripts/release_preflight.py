@@ -8,6 +8,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import re
 import subprocess
@@ -17,6 +18,15 @@ from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 
+EXPECTED_ENTRYPOINTS = (
+    "zulipchat-mcp",
+    "zulipchat-mcp-setup",
+    "zulipchat-mcp-integrate",
+)
+_ENTRYPOINT_RE = re.compile(
+    rf"^({'|'.join(map(re.escape, EXPECTED_ENTRYPOINTS))})\s*=", flags=re.MULTILINE
+)
+
 
 @dataclass
 class CheckResult:
@@ -27,8 +37,9 @@ class CheckResult:
     detail: str
 
 
+@functools.cache
 def _read_text(path: Path) -> str:
-    """Read UTF-8 text from a file."""
+    """Read UTF-8 text from a file, once per run."""
     return path.read_text(encoding="utf-8")
 
 
@@ -46,6 +57,7 @@ def _run_git(args: list[str]) -> str:
         ["git", *args],
         cwd=ROOT,
         check=True,
+        stdin=subprocess.DEVNULL,
         capture_output=True,
         text=True,
     )
@@ -112,12 +124,11 @@ def _check_server_json(version: str) -> list[CheckResult]:
 
 def _check_changelog(version: str) -> CheckResult:
     content = _read_text(ROOT / "CHANGELOG.md")
-    patterns = [
-        rf"^## \[{re.escape(version)}\](?:\s|-|$)",
-        rf"^## {re.escape(version)}\b",
-        rf"^## v{re.escape(version)}\b",
-    ]
-    found = any(re.search(pattern, content, flags=re.MULTILINE) for pattern in patterns)
+    escaped = re.escape(version)
+    header = re.compile(
+        rf"^## (?:\[{escaped}\](?:\s|-|$)|v?{escaped}\b)", flags=re.MULTILINE
+    )
+    found = header.search(content) is not None
     detail = (
         f"CHANGELOG.md section for {version}" if found else "Missing changelog section"
     )
@@ -141,8 +152,8 @@ def _check_release_md(version: str) -> CheckResult:
 
 def _check_required_scripts() -> CheckResult:
     content = _read_text(ROOT / "pyproject.toml")
-    expected = ["zulipchat-mcp", "zulipchat-mcp-setup", "zulipchat-mcp-integrate"]
-    missing = [name for name in expected if f"{name} =" not in content]
+    declared = set(_ENTRYPOINT_RE.findall(content))
+    missing = [name for name in EXPECTED_ENTRYPOINTS if name not in declared]
     passed = not missing
     detail = (
         "all expected entrypoints found" if passed else f"missing: {', '.join(missing)}"
@@ -7,23 +7,31 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .core.client import ZulipClientWrapper
 
-try:
-    from pathlib import Path
+_dotenv_loaded = False
 
-    from dotenv import load_dotenv
 
-    # Load .env file for development (only current directory)
+def _load_dotenv_once() -> None:
+    """Load a development .env from the current directory on first use."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        # python-dotenv not available, skip loading .env
+        return
+
     env_path = Path.cwd() / ".env"
     if env_path.exists():
         load_dotenv(env_path)
-except ImportError:
-    # python-dotenv not available, skip loading .env
-    pass
 
 
 @dataclass
@@ -53,6 +61,7 @@ class ConfigManager:
         bot_config_file: str | None = None,
         debug: bool | None = None,
     ) -> None:
+        _load_dotenv_once()
         self.config = self._load_config(
             cli_config_file=config_file,
             cli_bot_config_file=bot_config_file,
@@ -171,6 +180,10 @@ _config_manager: ConfigManager | None = None
 # Global identity state - tracks whether to use bot or user identity
 _current_identity: str = "user"  # "user" or "bot"
 
+# Client wrappers keyed by bot identity, reused so the underlying zulip
+# Client (and its pooled HTTP session) survives across tool calls.
+_clients: dict[bool, ZulipClientWrapper] = {}
+
 
 def init_config_manager(
     config_file: str | None = None,
@@ -191,6 +204,7 @@ def init_config_manager(
         The initialized ConfigManager instance
     """
     global _config_manager
+    _clients.clear()
     _config_manager = ConfigManager(
         config_file=config_file,
         bot_config_file=bot_config_file,
@@ -228,17 +242,26 @@ def set_current_identity(identity: str) -> None:
     _current_identity = identity
 
 
+def _cached_client(config: ConfigManager, use_bot: bool) -> ZulipClientWrapper:
+    """Return the shared wrapper for this identity, rebuilding on config change."""
+    from .core.client import ZulipClientWrapper
+
+    wrapper = _clients.get(use_bot)
+    if wrapper is None or wrapper.config_manager is not config:
+        wrapper = ZulipClientWrapper(config, use_bot_identity=use_bot)
+        _clients[use_bot] = wrapper
+    return wrapper
+
+
 def get_client() -> ZulipClientWrapper:
     """Get a ZulipClientWrapper with the current identity.
 
     This is the canonical way to get a client - it respects the
     current identity setting from switch_identity().
     """
-    from .core.client import ZulipClientWrapper
-
     config = get_config_manager()
     use_bot = _current_identity == "bot" and config.has_bot_credentials()
-    return ZulipClientWrapper(config, use_bot_identity=use_bot)
+    return _cached_client(config, use_bot)
 
 
 def get_bot_client() -> ZulipClientWrapper:
@@ -247,9 +270,7 @@ def get_bot_client() -> ZulipClientWrapper:
     Use this for operations that must always run as bot regardless
     of current identity setting (e.g., Agents-Channel operations).
     """
-    from .core.client import ZulipClientWrapper
-
     config = get_config_manager()
     if not config.has_bot_credentials():
         raise ValueError("Bot credentials not configured")
-    return ZulipClientWrapper(config, use_bot_identity=True)
+    return _cached_client(config, True)
@@ -30,7 +30,7 @@ class AgentTracker:
 
     # File paths
     AFK_STATE_FILE = CONFIG_DIR / "afk_state.json"  # kept for backward compat, unused
-    AGENT_REGISTRY_FILE = CONFIG_DIR / "agent_registry.json"
+    AGENT_REGISTRY_FILE = CONFIG_DIR / "agent_registry.jsonl"  # append-only log
     PENDING_RESPONSES_FILE = CONFIG_DIR / "pending_responses.json"
 
     # Preferred channel names in order of priority
@@ -42,7 +42,6 @@ class AgentTracker:
         Args:
             agent_stream: Override stream name. If None, will use default fallback.
         """
-        self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         self.session_id = str(uuid.uuid4())[:8]  # Short session ID
         # Runtime AFK flag (not persisted)
         self.afk_enabled: bool = False
@@ -60,14 +59,15 @@ class AgentTracker:
 
     def get_instance_identity(self) -> dict[str, Any]:
         """Return a lightweight identity description for the current instance."""
+        cwd = str(Path.cwd())
         try:
-            project = project_from_path(str(Path.cwd()))
+            project = project_from_path(cwd)
         except Exception:
-            project = Path.cwd().name
+            project = Path(cwd).name
         return {
             "project": project,
             "host": socket.gethostname(),
-            "cwd": str(Path.cwd()),
+            "cwd": cwd,
         }
 
     def register_agent(self, agent_type: str = "claude-code") -> dict[str, Any]:
@@ -89,14 +89,15 @@ class AgentTracker:
         stream_name = self.agents_channel
 
         # Create registration record
+        now = datetime.now().isoformat()
         registration = {
             "agent_type": agent_type,
             "session_id": self.session_id,
             "stream": stream_name,
             "topic": topic,
             "identity": identity,
-            "registered_at": datetime.now().isoformat(),
-            "last_active": datetime.now().isoformat(),
+            "registered_at": now,
+            "last_active": now,
         }
 
         # Save to registry
@@ -112,13 +113,16 @@ class AgentTracker:
         }
 
     def _update_agent_registry(self, record: dict[str, Any]) -> None:
-        """Append or update the local agent registry record."""
+        """Append a record to the local agent registry (one JSON object per line).
+
+        Appending keeps each registration O(1) instead of re-reading and
+        rewriting the whole registry every time an agent registers.
+        """
         try:
-            data: list[dict[str, Any]] = []
-            if self.AGENT_REGISTRY_FILE.exists():
-                data = json.loads(self.AGENT_REGISTRY_FILE.read_text()) or []
-            data.append(record)
-            self.AGENT_REGISTRY_FILE.write_text(json.dumps(data, indent=2))
+            # Created on first write so read-only trackers touch no files
+            self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            with self.AGENT_REGISTRY_FILE.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
         except Exception:
             # Best-effort; avoid raising in tracking
             pass
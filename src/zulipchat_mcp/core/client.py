@@ -12,7 +12,7 @@ from ..config import ConfigManager
 from .cache import cache_decorator, stream_cache, user_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class ZulipMessage:
     """Represents a Zulip message."""
 
@@ -26,7 +26,7 @@ class ZulipMessage:
     subject: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ZulipStream:
     """Represents a Zulip stream."""
 
@@ -36,7 +36,7 @@ class ZulipStream:
     invite_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ZulipUser:
     """Represents a Zulip user."""
 
@@ -518,10 +518,11 @@ class CommandChain:
             ZulipMCPError: On chain execution failure
         """
         # Initialize execution context
+        started = datetime.now()
         context = ExecutionContext(
             data=initial_context or {},
-            chain_id=f"{self.name}_{datetime.now().isoformat()}",
-            start_time=datetime.now(),
+            chain_id=f"{self.name}_{started.isoformat()}",
+            start_time=started,
         )
         self.execution_context = context
 
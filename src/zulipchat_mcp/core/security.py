@@ -18,6 +18,12 @@ from typing import Any
 # Global safety mode context - defaults to SAFE (unsafe_mode=False)
 _unsafe_mode: ContextVar[bool] = ContextVar("unsafe_mode", default=False)
 
+# Validation patterns, compiled once at import
+_STREAM_NAME_RE = re.compile(r"^[a-zA-Z0-9\-_\s\.]+$")
+_TOPIC_RE = re.compile(r"^[a-zA-Z0-9\-_\s\.,\!\?\(\)]+$")
+_EMOJI_NAME_RE = re.compile(r"^[a-zA-Z0-9_]+$")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 def set_unsafe_mode(enabled: bool) -> None:
     """Set the global safety mode.
@@ -126,7 +132,7 @@ def sanitize_input(content: str, max_length: int = 10000) -> str:
 
     # Remove potential command injections (conservative approach)
     # Only remove backticks that might be used for command substitution
-    content = re.sub(r"`", "", content)
+    content = content.replace("`", "")
 
     # Limit length
     return content[:max_length]
@@ -142,8 +148,7 @@ def validate_stream_name(name: str) -> bool:
         True if valid, False otherwise
     """
     # Allow alphanumeric, spaces, hyphens, underscores, and dots
-    pattern = r"^[a-zA-Z0-9\-_\s\.]+$"
-    return bool(re.match(pattern, name)) and 0 < len(name) <= 100
+    return bool(_STREAM_NAME_RE.match(name)) and 0 < len(name) <= 100
 
 
 def validate_topic(topic: str) -> bool:
@@ -156,8 +161,7 @@ def validate_topic(topic: str) -> bool:
         True if valid, False otherwise
     """
     # Topics can have more varied characters but still need validation
-    pattern = r"^[a-zA-Z0-9\-_\s\.,\!\?\(\)]+$"
-    return bool(re.match(pattern, topic)) and 0 < len(topic) <= 200
+    return bool(_TOPIC_RE.match(topic)) and 0 < len(topic) <= 200
 
 
 def validate_emoji(emoji_name: str) -> bool:
@@ -170,8 +174,7 @@ def validate_emoji(emoji_name: str) -> bool:
         True if valid, False otherwise
     """
     # Emoji names are typically alphanumeric with underscores
-    pattern = r"^[a-zA-Z0-9_]+$"
-    return bool(re.match(pattern, emoji_name)) and 0 < len(emoji_name) <= 50
+    return bool(_EMOJI_NAME_RE.match(emoji_name)) and 0 < len(emoji_name) <= 50
 
 
 def validate_email(email: str) -> bool:
@@ -183,8 +186,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email format, False otherwise
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_message_type(message_type: str) -> bool:
@@ -43,6 +43,41 @@ def _build_base_config(
     }
 
 
+def render_vscode_server(base: dict[str, Any]) -> dict[str, Any]:
+    """Render the VS Code/Copilot server entry (stdio transport)."""
+    return {
+        "type": "stdio",
+        "command": base["command"],
+        "args": base["args"],
+    }
+
+
+def render_opencode_server(base: dict[str, Any]) -> dict[str, Any]:
+    """Render the OpenCode server entry (single command list)."""
+    return {
+        "type": "local",
+        "enabled": True,
+        "command": [base["command"], *base["args"]],
+    }
+
+
+def _toml_string(value: str) -> str:
+    """Quote a value as a TOML basic string."""
+    # JSON string escapes are valid TOML basic-string escapes; TOML additionally
+    # forbids a raw DEL character
+    return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def render_codex_toml(base: dict[str, Any]) -> str:
+    """Render the Codex ``config.toml`` table with properly escaped values."""
+    rendered_args = ", ".join(_toml_string(str(arg)) for arg in base["args"])
+    return (
+        "[mcp_servers.zulipchat]\n"
+        f"command = {_toml_string(base['command'])}\n"
+        f"args = [{rendered_args}]"
+    )
+
+
 def _render_for_client(client: str, base: dict[str, Any]) -> str:
     if client == "claude-code":
         return "claude mcp add zulipchat -- " + " ".join(
@@ -60,36 +95,15 @@ def _render_for_client(client: str, base: dict[str, Any]) -> str:
         return json.dumps({"mcpServers": {"zulipchat": base}}, indent=2)
 
     if client == "vscode":
-        payload = {
-            "servers": {
-                "zulipchat": {
-                    "type": "stdio",
-                    "command": base["command"],
-                    "args": base["args"],
-                }
-            }
-        }
+        payload = {"servers": {"zulipchat": render_vscode_server(base)}}
         return json.dumps(payload, indent=2)
 
     if client == "opencode":
-        payload = {
-            "mcp": {
-                "zulipchat": {
-                    "type": "local",
-                    "enabled": True,
-                    "command": [base["command"], *base["args"]],
-                }
-            }
-        }
+        payload = {"mcp": {"zulipchat": render_opencode_server(base)}}
         return json.dumps(payload, indent=2)
 
     if client == "codex":
-        rendered_args = ", ".join(f'"{arg}"' for arg in base["args"])
-        return (
-            "[mcp_servers.zulipchat]\n"
-            f'command = "{base["command"]}"\n'
-            f"args = [{rendered_args}]"
-        )
+        return render_codex_toml(base)
 
     raise ValueError(f"Unsupported client: {client}")
 
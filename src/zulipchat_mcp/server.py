@@ -2,6 +2,7 @@
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from fastmcp import FastMCP
 
@@ -157,8 +158,16 @@ def main() -> None:
         from .config import get_client
 
         _warmup_client = get_client()
-        _warmup_client.get_users()  # populates user_cache via client wrapper
-        _warmup_client.get_streams()  # populates stream_cache via client wrapper
+        # zulip.Client builds its requests.Session lazily and without a lock, so
+        # create it before the fetches run in parallel; both then reuse that one
+        # session (and its connection pool), and the two independent round-trips
+        # overlap instead of running back to back
+        _warmup_client.client.ensure_session()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            users = pool.submit(_warmup_client.get_users)  # populates user_cache
+            streams = pool.submit(_warmup_client.get_streams)  # populates stream_cache
+            users.result()
+            streams.result()
         logger.info("User and stream caches warmed")
     except Exception as e:
         logger.debug(f"Cache warmup skipped: {e}")
@@ -24,6 +24,7 @@ class MessageListener:
 
     _BACKOFF_BASE = 2.0
     _BACKOFF_MAX = 120.0
+    _REQUEST_ID_RE = re.compile(r"\bID:\s*([A-Za-z0-9_-]{4,})\b")
 
     def __init__(
         self,
@@ -164,11 +165,9 @@ class MessageListener:
 
     def _extract_request_id(self, topic: str | None, content: str | None) -> str | None:
         if topic and topic.startswith("Agents/Input/"):
-            parts = topic.split("/")
-            if parts:
-                return parts[-1]
+            return topic.rpartition("/")[2]
         if content:
-            match = re.search(r"\bID:\s*([A-Za-z0-9_-]{4,})\b", content)
+            match = self._REQUEST_ID_RE.search(content)
             if match:
                 return match.group(1)
         return None
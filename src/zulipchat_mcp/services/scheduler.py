@@ -134,10 +134,12 @@ class MessageScheduler:
                 if users_resp.get("result") == "success"
                 else []
             )
+            # Index members by email once instead of rescanning per recipient
+            ids_by_email: dict[str, Any] = {}
+            for member in members:
+                ids_by_email.setdefault(member.get("email"), member.get("user_id"))
             for email in recipient_emails:
-                user_id = next(
-                    (u.get("user_id") for u in members if u.get("email") == email), None
-                )
+                user_id = ids_by_email.get(email)
                 if user_id is not None:
                     user_ids.append(int(user_id))
 
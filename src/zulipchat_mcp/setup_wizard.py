@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
+import stat
 import sys
 from pathlib import Path
 from typing import Any
@@ -16,6 +18,11 @@ from typing import Any
 from zulip import Client
 
 from . import __version__
+from .integrations.registry import (
+    render_codex_toml,
+    render_opencode_server,
+    render_vscode_server,
+)
 
 # ANSI colors for terminal output
 BLUE = "\033[94m"
@@ -40,16 +47,23 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+HEADER = "\n".join(
+    [
+        f"\n{BLUE}{BOLD}ZulipChat MCP Setup Wizard{RESET}",
+        "=" * 48,
+        "This wizard will:",
+        "  1. Find zuliprc files on your system",
+        "  2. Validate your Zulip credentials",
+        "  3. Choose core (19) or extended (55) tool mode",
+        "  4. Generate MCP client configuration",
+        "=" * 48 + "\n",
+    ]
+)
+
+
 def print_header() -> None:
     """Print the wizard header."""
-    print(f"\n{BLUE}{BOLD}ZulipChat MCP Setup Wizard{RESET}")
-    print("=" * 48)
-    print("This wizard will:")
-    print("  1. Find zuliprc files on your system")
-    print("  2. Validate your Zulip credentials")
-    print("  3. Choose core (19) or extended (55) tool mode")
-    print("  4. Generate MCP client configuration")
-    print("=" * 48 + "\n")
+    print(HEADER)
 
 
 def prompt(question: str, default: str | None = None) -> str:
@@ -85,13 +99,20 @@ def scan_for_zuliprc_files() -> list[Path]:
         (home / "Downloads", "*zuliprc*"),
     ]
 
+    # Patterns overlap heavily, so track every path already considered
+    seen = set(found)
     for base_dir, pattern in patterns:
         if base_dir.exists():
             try:
                 for match in base_dir.glob(pattern):
-                    if match.is_file() and match not in found:
+                    if match in seen:
+                        continue
+                    seen.add(match)
+                    if match.is_file():
                         try:
-                            content = match.read_text(errors="ignore")[:500]
+                            # Only the head is needed to spot the [api] section
+                            with match.open(errors="ignore") as fh:
+                                content = fh.read(500)
                             if "[api]" in content.lower():
                                 found.append(match)
                         except (OSError, PermissionError):
@@ -144,16 +165,23 @@ def validate_zuliprc(path: Path, silent: bool = False) -> dict[str, Any] | None:
         return None
 
 
+def _display_path(path: Path, home: Path) -> Path:
+    """Abbreviate a path under ``home`` as ``~/...`` for display."""
+    try:
+        return Path("~") / path.relative_to(home)
+    except ValueError:
+        return path
+
+
 def display_found_files(files: list[Path]) -> None:
     """Display found zuliprc files with indices."""
-    print(f"\n{BOLD}Found {len(files)} zuliprc file(s):{RESET}\n")
-    for i, path in enumerate(files, 1):
-        display_path: Path = path
-        try:
-            display_path = Path("~") / path.relative_to(Path.home())
-        except ValueError:
-            pass
-        print(f"  {BOLD}{i}.{RESET} {display_path}")
+    home = Path.home()
+    lines = [f"\n{BOLD}Found {len(files)} zuliprc file(s):{RESET}\n"]
+    lines.extend(
+        f"  {BOLD}{i}.{RESET} {_display_path(path, home)}"
+        for i, path in enumerate(files, 1)
+    )
+    print("\n".join(lines))
 
 
 def _is_bot_like_zuliprc(path: Path) -> bool:
@@ -161,17 +189,17 @@ def _is_bot_like_zuliprc(path: Path) -> bool:
     if "bot" in path.name.lower():
         return True
 
+    # Stream lines so we stop reading at the first email= entry
     try:
-        content = path.read_text(errors="ignore")
+        with path.open(errors="ignore") as fh:
+            for raw_line in fh:
+                line = raw_line.strip()
+                if line.lower().startswith("email="):
+                    email = line.split("=", 1)[1].strip().lower()
+                    return "bot" in email
     except (OSError, PermissionError):
         return False
 
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-        if line.lower().startswith("email="):
-            email = line.split("=", 1)[1].strip().lower()
-            return "bot" in email
-
     return False
 
 
@@ -204,15 +232,14 @@ def select_identity(
             return validate_zuliprc(path)
         return None
 
-    print(f"\n{BOLD}Select {identity_type} identity:{RESET}")
-    for i, path in enumerate(available, 1):
-        try:
-            display = Path("~") / path.relative_to(Path.home())
-        except ValueError:
-            display = path
-        print(f"  {i}. {display}")
-    print(f"  {len(available) + 1}. Enter path manually")
-    print(f"  {len(available) + 2}. Skip")
+    home = Path.home()
+    menu = [f"\n{BOLD}Select {identity_type} identity:{RESET}"]
+    menu.extend(
+        f"  {i}. {_display_path(path, home)}" for i, path in enumerate(available, 1)
+    )
+    menu.append(f"  {len(available) + 1}. Enter path manually")
+    menu.append(f"  {len(available) + 2}. Skip")
+    print("\n".join(menu))
 
     while True:
         choice = prompt("Choice", default="1")
@@ -376,51 +403,66 @@ def write_config_to_file(
     root_key: str = "mcpServers",
 ) -> bool:
     """Write MCP config to client configuration file."""
+    tmp_path: Path | None = None
     try:
-        if config_path.exists():
-            backup = config_path.with_suffix(config_path.suffix + ".bak")
-            shutil.copy2(config_path, backup)
-            print(f"{DIM}Backup created: {backup}{RESET}")
+        # Rewrite the real file behind a symlink, keeping its permissions
+        target = config_path
+        mode: int | None = None
+        # Open directly rather than exists()-then-open: one syscall fewer and
+        # no window for the file to vanish in between
+        try:
             with open(config_path) as f:
                 settings = json.load(f)
-        else:
+        except FileNotFoundError:
             config_path.parent.mkdir(parents=True, exist_ok=True)
             settings = {}
+        else:
+            # Leave the file (and its mtime) alone when nothing would change
+            if settings.get(root_key, {}).get(server_key) == mcp_config:
+                print(f"{GREEN}Configuration already up to date: {config_path}{RESET}")
+                return True
+
+            backup = config_path.with_suffix(config_path.suffix + ".bak")
+            shutil.copy2(config_path, backup)
+            print(f"{DIM}Backup created: {backup}{RESET}")
+
+            target = config_path.resolve()
+            mode = stat.S_IMODE(target.stat().st_mode)
 
         if root_key not in settings:
             settings[root_key] = {}
 
         settings[root_key][server_key] = mcp_config
 
-        with open(config_path, "w") as f:
-            json.dump(settings, f, indent=2)
+        # Write to a new temp file beside the target and swap it in so a crash
+        # never leaves the client's config truncated. O_EXCL never clobbers an
+        # existing file, and creating it with the target's mode keeps a private
+        # config (which may hold other servers' keys) private throughout.
+        candidate = target.with_name(f".{target.name}.{os.urandom(4).hex()}.tmp")
+        fd = os.open(
+            candidate,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+            0o666 if mode is None else mode,
+        )
+        tmp_path = candidate
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(settings, indent=2))
+        if mode is not None:
+            # os.open() applied the umask; restore the original mode exactly
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+        tmp_path = None
 
         print(f"{GREEN}Configuration written to {config_path}{RESET}")
         return True
 
     except Exception as e:
         print(f"{RED}Failed to write config: {e}{RESET}")
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
         return False
 
 
-def _render_vscode_config(base: dict[str, Any]) -> dict[str, Any]:
-    """Render VS Code/Copilot config shape."""
-    return {
-        "type": "stdio",
-        "command": base["command"],
-        "args": base["args"],
-    }
-
-
-def _render_opencode_config(base: dict[str, Any]) -> dict[str, Any]:
-    """Render OpenCode config shape."""
-    return {
-        "type": "local",
-        "enabled": True,
-        "command": [base["command"], *base["args"]],
-    }
-
-
 def _print_config_block(title: str, payload: dict[str, Any]) -> None:
     """Print a formatted JSON block."""
     print(f"\n{BOLD}{title}{RESET}")
@@ -536,10 +578,7 @@ def main(argv: list[str] | None = None) -> None:
     elif client_choice == "4":
         config_path = get_mcp_client_config_path("codex")
         print(f"\n{BOLD}Codex configuration (config.toml){RESET}")
-        args = ", ".join(f'"{arg}"' for arg in mcp_config["args"])
-        print(
-            f"\n[mcp_servers.zulipchat]\ncommand = \"{mcp_config['command']}\"\nargs = [{args}]\n"
-        )
+        print(f"\n{render_codex_toml(mcp_config)}\n")
         if config_path:
             print(f"Suggested path: {config_path}")
 
@@ -559,7 +598,7 @@ def main(argv: list[str] | None = None) -> None:
 
     elif client_choice == "7":
         config_path = get_mcp_client_config_path("vscode")
-        vscode_server = _render_vscode_config(mcp_config)
+        vscode_server = render_vscode_server(mcp_config)
         payload = {"servers": {"zulipchat": vscode_server}}
         _print_config_block("VS Code / Copilot configuration", payload)
         if config_path:
@@ -575,7 +614,7 @@ def main(argv: list[str] | None = None) -> None:
 
     elif client_choice == "8":
         config_path = get_mcp_client_config_path("opencode")
-        opencode_server = _render_opencode_config(mcp_config)
+        opencode_server = render_opencode_server(mcp_config)
         payload = {"mcp": {"zulipchat": opencode_server}}
         _print_config_block("OpenCode configuration", payload)
         if config_path:
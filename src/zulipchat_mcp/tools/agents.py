@@ -24,6 +24,13 @@ _tracker: AgentTracker | None = None
 _client: ZulipClientWrapper | None = None
 _agent_stream: str | None = None  # Cached stream name
 
+_DEV_NOTIFY_VALUES = frozenset({"1", "true", "True"})
+
+
+def _dev_notify_enabled() -> bool:
+    """Whether ZULIP_DEV_NOTIFY forces notifications regardless of AFK state."""
+    return os.getenv("ZULIP_DEV_NOTIFY", "0") in _DEV_NOTIFY_VALUES
+
 
 def _get_client_bot() -> ZulipClientWrapper:
     global _client
@@ -87,6 +94,7 @@ def register_agent(agent_type: str = "claude-code") -> dict[str, Any]:
             db = DatabaseManager()
             agent_id = str(uuid.uuid4())
             instance_id = str(uuid.uuid4())
+            now = datetime.now(timezone.utc)
 
             # Insert or update agent record
             db.execute(
@@ -94,7 +102,7 @@ def register_agent(agent_type: str = "claude-code") -> dict[str, Any]:
                 INSERT OR REPLACE INTO agents (agent_id, agent_type, created_at, metadata)
                 VALUES (?, ?, ?, ?)
                 """,
-                (agent_id, agent_type, datetime.now(timezone.utc), "{}"),
+                (agent_id, agent_type, now, "{}"),
             )
 
             # Insert agent instance
@@ -110,7 +118,7 @@ def register_agent(agent_type: str = "claude-code") -> dict[str, Any]:
                     str(uuid.uuid4())[:8],  # Short session ID
                     str(os.getcwd()),
                     os.getenv("HOSTNAME", "localhost"),
-                    datetime.now(timezone.utc),
+                    now,
                 ),
             )
 
@@ -120,7 +128,7 @@ def register_agent(agent_type: str = "claude-code") -> dict[str, Any]:
                 INSERT OR REPLACE INTO afk_state (id, is_afk, reason, updated_at)
                 VALUES (1, ?, ?, ?)
                 """,
-                (False, "Agent ready for normal operations", datetime.now(timezone.utc)),
+                (False, "Agent ready for normal operations", now),
             )
 
             # Discover best available stream for agent communication
@@ -152,17 +160,14 @@ def agent_message(
         with LogContext(logger, tool="agent_message", agent_type=agent_type):
             track_tool_call("agent_message")
             try:
-                afk_state = DatabaseManager().get_afk_state() or {}
-                dev_override = os.getenv("ZULIP_DEV_NOTIFY", "0") in (
-                    "1",
-                    "true",
-                    "True",
-                )
-                if not afk_state.get("is_afk") and not dev_override:
-                    return {
-                        "status": "skipped",
-                        "reason": "AFK disabled; notifications gated",
-                    }
+                # Check the env override first so it skips the AFK DB lookup
+                if not _dev_notify_enabled():
+                    afk_state = DatabaseManager().get_afk_state() or {}
+                    if not afk_state.get("is_afk"):
+                        return {
+                            "status": "skipped",
+                            "reason": "AFK disabled; notifications gated",
+                        }
                 msg_info = _get_tracker().format_agent_message(
                     content, agent_type, require_response
                 )
@@ -263,13 +268,13 @@ def request_user_input(
     with Timer("zulip_mcp_tool_duration_seconds", {"tool": "request_user_input"}):
         track_tool_call("request_user_input")
         try:
-            afk_state = DatabaseManager().get_afk_state() or {}
-            dev_override = os.getenv("ZULIP_DEV_NOTIFY", "0") in ("1", "true", "True")
-            if not afk_state.get("is_afk") and not dev_override:
-                return {
-                    "status": "skipped",
-                    "reason": "AFK disabled; input request gated",
-                }
+            if not _dev_notify_enabled():
+                afk_state = DatabaseManager().get_afk_state() or {}
+                if not afk_state.get("is_afk"):
+                    return {
+                        "status": "skipped",
+                        "reason": "AFK disabled; input request gated",
+                    }
             db = DatabaseManager()
 
             # Get agent instance and metadata to determine routing
@@ -301,11 +306,12 @@ def request_user_input(
             )
 
             # Prepare message
-            message = f"**Input Requested** (ID: {request_id})\n\n{question}"
+            sections = [f"**Input Requested** (ID: {request_id})", question]
             if options:
-                message += "\n\nOptions:\n" + "\n".join(f"- {opt}" for opt in options)
+                sections.append("Options:\n" + "\n".join(f"- {opt}" for opt in options))
             if context:
-                message += f"\n\nContext: {context}"
+                sections.append(f"Context: {context}")
+            message = "\n\n".join(sections)
 
             client = _get_client_bot()
 
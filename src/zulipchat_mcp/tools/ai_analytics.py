@@ -12,6 +12,21 @@ from mcp.types import TextContent
 
 from ..config import get_client
 
+# Prompt templates keyed by analysis type; "{data}" is filled with the summary
+_STREAM_ANALYSIS_PROMPTS = {
+    "engagement": "Analyze engagement patterns in this stream:\n\n{data}\n\nProvide insights on activity levels, participation, and trends.",
+    "collaboration": "Analyze collaboration quality in this stream:\n\n{data}\n\nProvide insights on teamwork, communication patterns, and effectiveness.",
+    "sentiment": "Analyze team sentiment in this stream:\n\n{data}\n\nProvide insights on mood, energy, and team dynamics.",
+    "summary": "Provide a comprehensive summary of this stream:\n\n{data}\n\nInclude key patterns, notable discussions, and insights.",
+}
+
+_TEAM_ANALYSIS_PROMPTS = {
+    "productivity": "Analyze team productivity from this activity:\n\n{data}\n\nProvide insights on output, focus areas, and productivity patterns.",
+    "blockers": "Identify team blockers and challenges:\n\n{data}\n\nHighlight obstacles, delays, and areas needing support.",
+    "energy": "Assess team energy and morale:\n\n{data}\n\nProvide insights on team spirit, enthusiasm, and well-being.",
+    "progress": "Analyze team progress and achievements:\n\n{data}\n\nIdentify accomplishments, milestones, and forward momentum.",
+}
+
 
 async def get_daily_summary(
     streams: list[str] | None = None,
@@ -75,26 +90,22 @@ async def analyze_stream_with_llm(
             return {"status": "success", "analysis": "No messages found for analysis"}
 
         # Prepare data for LLM
-        data_summary = (
-            f"Stream: #{stream_name} ({len(messages)} messages, {time_period})\n\n"
-        )
+        parts = [f"Stream: #{stream_name} ({len(messages)} messages, {time_period})\n\n"]
         for i, msg in enumerate(messages[:20]):  # Limit for tokens
-            data_summary += f"{i+1}. {msg['sender']}: {msg['content'][:150]}...\n"
+            parts.append(f"{i+1}. {msg['sender']}: {msg['content'][:150]}...\n")
+        data_summary = "".join(parts)
 
         # Create analysis prompt
         if custom_prompt:
             analysis_prompt = custom_prompt.replace("{data}", data_summary)
         else:
-            default_prompts = {
-                "engagement": f"Analyze engagement patterns in this stream:\n\n{data_summary}\n\nProvide insights on activity levels, participation, and trends.",
-                "collaboration": f"Analyze collaboration quality in this stream:\n\n{data_summary}\n\nProvide insights on teamwork, communication patterns, and effectiveness.",
-                "sentiment": f"Analyze team sentiment in this stream:\n\n{data_summary}\n\nProvide insights on mood, energy, and team dynamics.",
-                "summary": f"Provide a comprehensive summary of this stream:\n\n{data_summary}\n\nInclude key patterns, notable discussions, and insights.",
-            }
-            analysis_prompt = default_prompts.get(
-                analysis_type,
-                f"Analyze this stream data for {analysis_type}:\n\n{data_summary}",
-            )
+            template = _STREAM_ANALYSIS_PROMPTS.get(analysis_type)
+            if template is None:
+                analysis_prompt = (
+                    f"Analyze this stream data for {analysis_type}:\n\n{data_summary}"
+                )
+            else:
+                analysis_prompt = template.format(data=data_summary)
 
         # Use LLM for analysis
         try:
@@ -157,7 +168,9 @@ async def analyze_team_activity_with_llm(
             }
 
         # Prepare team data summary
-        data_summary = f"Team Activity ({len(all_messages)} messages across {len(team_streams)} streams, {days_back} days):\n\n"
+        parts = [
+            f"Team Activity ({len(all_messages)} messages across {len(team_streams)} streams, {days_back} days):\n\n"
+        ]
 
         # Group by stream
         by_stream: dict[str, list[dict[str, Any]]] = {}
@@ -168,25 +181,23 @@ async def analyze_team_activity_with_llm(
             by_stream[stream].append(msg)
 
         for stream, msgs in list(by_stream.items())[:5]:  # Top 5 streams
-            data_summary += f"#{stream} ({len(msgs)} messages):\n"
+            parts.append(f"#{stream} ({len(msgs)} messages):\n")
             for msg in msgs[:5]:  # Top 5 messages per stream
-                data_summary += f"  - {msg['sender']}: {msg['content'][:100]}...\n"
-            data_summary += "\n"
+                parts.append(f"  - {msg['sender']}: {msg['content'][:100]}...\n")
+            parts.append("\n")
+        data_summary = "".join(parts)
 
         # Create analysis prompt
         if custom_prompt:
             analysis_prompt = custom_prompt.replace("{data}", data_summary)
         else:
-            default_prompts = {
-                "productivity": f"Analyze team productivity from this activity:\n\n{data_summary}\n\nProvide insights on output, focus areas, and productivity patterns.",
-                "blockers": f"Identify team blockers and challenges:\n\n{data_summary}\n\nHighlight obstacles, delays, and areas needing support.",
-                "energy": f"Assess team energy and morale:\n\n{data_summary}\n\nProvide insights on team spirit, enthusiasm, and well-being.",
-                "progress": f"Analyze team progress and achievements:\n\n{data_summary}\n\nIdentify accomplishments, milestones, and forward momentum.",
-            }
-            analysis_prompt = default_prompts.get(
-                analysis_focus,
-                f"Analyze team activity for {analysis_focus}:\n\n{data_summary}",
-            )
+            template = _TEAM_ANALYSIS_PROMPTS.get(analysis_focus)
+            if template is None:
+                analysis_prompt = (
+                    f"Analyze team activity for {analysis_focus}:\n\n{data_summary}"
+                )
+            else:
+                analysis_prompt = template.format(data=data_summary)
 
         # Use LLM for analysis
         try:
@@ -25,6 +25,27 @@ from ..core.commands.engine import (
 )
 from ..core.commands.workflows import ChainBuilder
 
+# Example command structures shown in validation errors, built once at import
+_COMMAND_FORMAT_EXAMPLES: dict[str, dict[str, Any]] = {
+    "send_message": {
+        "type": "send_message",
+        "params": {
+            "message_type_key": "msg_type",
+            "to_key": "recipient",
+            "content_key": "text",
+            "topic_key": "subject",
+        },
+    },
+    "search_messages": {
+        "type": "search_messages",
+        "params": {"query_key": "search_query"},
+    },
+    "wait_for_response": {
+        "type": "wait_for_response",
+        "params": {"request_id_key": "request_id"},
+    },
+}
+
 
 def _get_command_format_example(cmd_type: str = "send_message") -> dict[str, Any]:
     """Get example format for command types.
@@ -32,26 +53,9 @@ def _get_command_format_example(cmd_type: str = "send_message") -> dict[str, Any
     Returns:
         Dict showing correct command structure
     """
-    examples = {
-        "send_message": {
-            "type": "send_message",
-            "params": {
-                "message_type_key": "msg_type",
-                "to_key": "recipient",
-                "content_key": "text",
-                "topic_key": "subject",
-            },
-        },
-        "search_messages": {
-            "type": "search_messages",
-            "params": {"query_key": "search_query"},
-        },
-        "wait_for_response": {
-            "type": "wait_for_response",
-            "params": {"request_id_key": "request_id"},
-        },
-    }
-    return examples.get(cmd_type, examples["send_message"])
+    return _COMMAND_FORMAT_EXAMPLES.get(
+        cmd_type, _COMMAND_FORMAT_EXAMPLES["send_message"]
+    )
 
 
 class WaitForResponseCommand(Command):
@@ -249,20 +249,26 @@ async def upload_file(
 
             # Optionally share in stream
             if stream and file_url:
-                share_content = message or f"📎 Uploaded file: **{filename}**"
                 try:
                     shared_file_url = _resolve_file_url(client, file_url)
                 except ValueError:
                     shared_file_url = file_url
-                share_content += f"\n{shared_file_url}"
 
                 # Add file metadata to share message
                 size_mb = validation["metadata"]["size"] / (1024 * 1024)
                 if size_mb >= 1:
-                    share_content += f"\n📊 Size: {size_mb:.1f} MB"
+                    size_line = f"📊 Size: {size_mb:.1f} MB"
                 else:
                     size_kb = validation["metadata"]["size"] / 1024
-                    share_content += f"\n📊 Size: {size_kb:.1f} KB"
+                    size_line = f"📊 Size: {size_kb:.1f} KB"
+
+                share_content = "\n".join(
+                    [
+                        message or f"📎 Uploaded file: **{filename}**",
+                        shared_file_url,
+                        size_line,
+                    ]
+                )
 
                 share_result = client.send_message(
                     "stream", stream, share_content, topic
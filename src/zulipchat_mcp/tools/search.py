@@ -51,18 +51,7 @@ async def resolve_user_identifier(
 ) -> dict[str, Any]:
     """Resolve partial names, emails, or IDs to full user info."""
     try:
-        # Try exact email match first
-        if "@" in identifier:
-            response = client.get_users()
-            if response.get("result") == "success":
-                users = response.get("members", [])
-                exact_match = next(
-                    (user for user in users if user.get("email") == identifier), None
-                )
-                if exact_match:
-                    return exact_match
-
-        # Get all users for fuzzy matching
+        # Fetch the user list once; every matching pass below reuses it
         response = client.get_users()
         if response.get("result") != "success":
             raise Exception(
@@ -71,11 +60,19 @@ async def resolve_user_identifier(
 
         users = response.get("members", [])
 
+        # Try exact email match first
+        if "@" in identifier:
+            exact_match = next(
+                (user for user in users if user.get("email") == identifier), None
+            )
+            if exact_match:
+                return exact_match
+
+        needle = identifier.lower()
+
         # Try exact full name match first
         exact_matches = [
-            user
-            for user in users
-            if user.get("full_name", "").lower() == identifier.lower()
+            user for user in users if user.get("full_name", "").lower() == needle
         ]
         if len(exact_matches) == 1:
             return exact_matches[0]
@@ -85,15 +82,9 @@ async def resolve_user_identifier(
         # Fuzzy matching with similarity scoring
         partial_matches = []
         for user in users:
-            full_name = user.get("full_name", "")
-            if (
-                identifier.lower() in full_name.lower()
-                or SequenceMatcher(None, full_name.lower(), identifier.lower()).ratio()
-                > 0.6
-            ):
-                score = SequenceMatcher(
-                    None, full_name.lower(), identifier.lower()
-                ).ratio()
+            full_name = user.get("full_name", "").lower()
+            score = SequenceMatcher(None, full_name, needle).ratio()
+            if needle in full_name or score > 0.6:
                 partial_matches.append((score, user))
 
         # Sort by similarity score
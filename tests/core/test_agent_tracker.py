@@ -26,7 +26,7 @@ class TestAgentTracker:
                 ),
                 patch(
                     "src.zulipchat_mcp.core.agent_tracker.AgentTracker.AGENT_REGISTRY_FILE",
-                    tmp_path / ".mcp" / "agent_registry.json",
+                    tmp_path / ".mcp" / "agent_registry.jsonl",
                 ),
                 patch(
                     "src.zulipchat_mcp.core.agent_tracker.AgentTracker.PENDING_RESPONSES_FILE",
@@ -39,13 +39,16 @@ class TestAgentTracker:
     def tracker(self, mock_cwd):
         return AgentTracker()
 
-    def test_init_creates_config_dir(self, mock_cwd):
-        """Test initialization creates .mcp directory."""
+    def test_init_defers_config_dir(self, mock_cwd):
+        """Test initialization does not create .mcp until something is written."""
         tracker = AgentTracker()
-        assert (mock_cwd / ".mcp").exists()
+        assert not (mock_cwd / ".mcp").exists()
         assert tracker.afk_enabled is False
         assert tracker.session_id is not None
 
+        tracker.register_agent("test-agent")
+        assert (mock_cwd / ".mcp").is_dir()
+
     def test_get_instance_identity(self, tracker, mock_cwd):
         """Test getting instance identity."""
         with patch("socket.gethostname", return_value="testhost"):
@@ -63,15 +66,15 @@ class TestAgentTracker:
         assert "test-agent" in result["topic"]
 
         # Verify file written
-        registry_file = mock_cwd / ".mcp" / "agent_registry.json"
+        registry_file = mock_cwd / ".mcp" / "agent_registry.jsonl"
         assert registry_file.exists()
-        data = json.loads(registry_file.read_text())
+        data = [json.loads(line) for line in registry_file.read_text().splitlines()]
         assert len(data) == 1
         assert data[0]["agent_type"] == "test-agent"
 
     def test_update_agent_registry_append(self, tracker, mock_cwd):
         """Test appending to agent registry."""
-        registry_file = mock_cwd / ".mcp" / "agent_registry.json"
+        registry_file = mock_cwd / ".mcp" / "agent_registry.jsonl"
 
         # Initial record
         tracker._update_agent_registry({"id": 1})
@@ -79,7 +82,7 @@ class TestAgentTracker:
         # Second record
         tracker._update_agent_registry({"id": 2})
 
-        data = json.loads(registry_file.read_text())
+        data = [json.loads(line) for line in registry_file.read_text().splitlines()]
         assert len(data) == 2
         assert data[0]["id"] == 1
         assert data[1]["id"] == 2
@@ -96,7 +99,7 @@ class TestAgentTracker:
 
     def test_update_registry_handles_error(self, tracker, mock_cwd):
         """Test graceful handling of write errors."""
-        # Mock write_text to fail
-        with patch("pathlib.Path.write_text", side_effect=OSError("Disk full")):
+        # Mock open to fail
+        with patch("pathlib.Path.open", side_effect=OSError("Disk full")):
             # Should not raise exception
             tracker._update_agent_registry({"id": 1})
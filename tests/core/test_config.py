@@ -197,3 +197,24 @@ class TestConfigManagerSingleton:
 
         # Cleanup
         config_module._config_manager = None
+
+    def test_get_client_reuses_wrapper_until_reinit(self, tmp_path):
+        """Test that get_client shares one wrapper per config manager."""
+        import src.zulipchat_mcp.config as config_module
+        from src.zulipchat_mcp.config import get_client, init_config_manager
+
+        config_file = tmp_path / "zuliprc"
+        config_file.write_text(
+            "[api]\nemail=test@example.com\nkey=abc123\nsite=https://test.zulipchat.com\n"
+        )
+
+        init_config_manager(config_file=str(config_file))
+        first = get_client()
+        assert get_client() is first
+
+        init_config_manager(config_file=str(config_file))
+        assert get_client() is not first
+
+        # Cleanup
+        config_module._config_manager = None
+        config_module._clients.clear()
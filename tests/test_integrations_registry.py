@@ -40,6 +40,19 @@ def test_print_codex_includes_extended_flag(monkeypatch, capsys):
     assert '"--extended-tools"' in output
 
 
+def test_codex_toml_escapes_quotes_and_backslashes():
+    """Codex render should produce valid TOML for Windows paths and quotes."""
+    tomllib = pytest.importorskip("tomllib")
+    path = 'C:\\Users\\me\\"zulip"\\.zuliprc'
+    base = registry._build_base_config(path, None, False)
+
+    parsed = tomllib.loads(registry.render_codex_toml(base))
+
+    server = parsed["mcp_servers"]["zulipchat"]
+    assert server["command"] == "uvx"
+    assert server["args"] == ["zulipchat-mcp", "--zulip-config-file", path]
+
+
 def test_print_vscode_returns_servers_shape(monkeypatch, capsys):
     """VS Code render should use `servers` key with stdio type."""
     _run_main(
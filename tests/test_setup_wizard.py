@@ -1,6 +1,8 @@
 """Tests for setup_wizard.py."""
 
 import json
+import os
+import stat
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -208,6 +210,88 @@ class TestWriteConfigToFile:
         backup = tmp_path / "config.json.bak"
         assert backup.exists()
 
+    def test_skips_unchanged_config(self, tmp_path):
+        """Test that an identical entry is not rewritten or backed up."""
+        config_path = tmp_path / "config.json"
+        original = json.dumps({"mcpServers": {"server": {"command": "test"}}})
+        config_path.write_text(original)
+
+        success = write_config_to_file(config_path, "server", {"command": "test"})
+
+        assert success is True
+        assert config_path.read_text() == original
+        assert not (tmp_path / "config.json.bak").exists()
+
+    def test_replaces_atomically(self, tmp_path):
+        """Test that no temp file is left behind after writing."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
+
+        write_config_to_file(config_path, "server", {"command": "test"})
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "config.json",
+            "config.json.bak",
+        ]
+        content = json.loads(config_path.read_text())
+        assert content["mcpServers"]["server"] == {"command": "test"}
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_preserves_file_mode(self, tmp_path):
+        """Test that a private config is never written with wider permissions."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
+        config_path.chmod(0o600)
+        created_modes = []
+        real_open = os.open
+
+        def spy_open(path, flags, mode=0o777):
+            created_modes.append(mode)
+            return real_open(path, flags, mode)
+
+        with patch("src.zulipchat_mcp.setup_wizard.os.open", side_effect=spy_open):
+            assert write_config_to_file(config_path, "server", {"command": "test"})
+
+        assert created_modes == [0o600]
+        assert stat.S_IMODE(config_path.stat().st_mode) == 0o600
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+    def test_updates_symlink_target(self, tmp_path):
+        """Test that a symlinked config keeps its link and updates the target."""
+        real_dir = tmp_path / "dotfiles"
+        real_dir.mkdir()
+        real_path = real_dir / "config.json"
+        real_path.write_text("{}")
+        config_path = tmp_path / "config.json"
+        config_path.symlink_to(real_path)
+
+        assert write_config_to_file(config_path, "server", {"command": "test"})
+
+        assert config_path.is_symlink()
+        content = json.loads(real_path.read_text())
+        assert content["mcpServers"]["server"] == {"command": "test"}
+        assert [p.name for p in real_dir.iterdir()] == ["config.json"]
+
+    def test_failed_write_keeps_unrelated_tmp_file(self, tmp_path):
+        """Test that a failed swap removes only its own temp file."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
+        unrelated = tmp_path / "config.json.tmp"
+        unrelated.write_text("keep me")
+
+        with patch(
+            "src.zulipchat_mcp.setup_wizard.os.replace", side_effect=OSError("boom")
+        ):
+            assert write_config_to_file(config_path, "server", {}) is False
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "config.json",
+            "config.json.bak",
+            "config.json.tmp",
+        ]
+        assert unrelated.read_text() == "keep me"
+        assert config_path.read_text() == "{}"
+
 
 class TestHelpers:
     """Tests for helper functions."""
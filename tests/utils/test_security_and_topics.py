@@ -49,6 +49,34 @@ def test_secure_log_redacts_custom_keys() -> None:
     assert "session=ok" in redacted
 
 
+def _reference_secure_log(message: str, sensitive_keys: list[str]) -> str:
+    """Sequential per-key redaction that secure_log must stay equivalent to."""
+    sanitized = message
+    for key in sensitive_keys:
+        pattern = rf"({key}['\"]?\s*[:=]\s*['\"]?)([^'\"]+)(['\"]?)"
+        sanitized = re.sub(pattern, r"\1[REDACTED]\3", sanitized, flags=re.IGNORECASE)
+    return sanitized
+
+
+def test_secure_log_matches_per_key_redaction() -> None:
+    keys = ["api_key", "password", "token", "secret"]
+    messages = [
+        "password: api_key'=zzz",
+        "token:password'=hunter2",
+        "secret=token: abc",
+        'api_key="abcd1234"; password="hunter2"; token = "xyz"; SECRET: token123',
+        "nothing sensitive here",
+    ]
+    for msg in messages:
+        assert secure_log(msg) == _reference_secure_log(msg, keys)
+        assert secure_log(msg, sensitive_keys=keys[::-1]) == _reference_secure_log(
+            msg, keys[::-1]
+        )
+
+    assert secure_log("password: api_key'=zzz") == "password: [REDACTED]'=[REDACTED]"
+    assert "hunter2" not in secure_log("token:password'=hunter2")
+
+
 def test_project_from_path_happy_and_exception_paths() -> None:
     assert project_from_path("/home/user/repo") == "repo"
 
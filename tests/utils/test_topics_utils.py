@@ -14,6 +14,9 @@ def test_project_from_path_variants() -> None:
     assert project_from_path(None) == "Project"
     assert project_from_path("") == "Project"
     assert project_from_path("/a/b/c") == "c"
+    assert project_from_path("/a/b/c/") == "c"
+    assert project_from_path(".") == "Project"
+    assert project_from_path("foo/.") == "foo"
 
 
 def test_topic_builders() -> None: